@@ -1,16 +1,74 @@
 from datamodel import Order, OrderDepth, TradingState
 from typing import Dict, List
 from collections import deque
+import numpy as np
 from datetime import datetime
-import statistics
+
+# Numba is optional: when it is installed, non-debug runs use a compiled kernel for the
+# moving-average/crossover step; otherwise the plain Python methods below are used.
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+SIGNALS = {1: "BUY", -1: "SELL", 0: "HOLD"}
+
+
+@njit(cache=True)
+def _ma_step(ring, state, mid_price, short_window, long_window, deviation):
+    """
+    Compiled equivalent of update_moving_averages + detect_signal for one tick.
+    - ring: float64[long_window] ring buffer of mid-prices, updated in place.
+    - state: float64[4] of [ticks seen, short sum, long sum, MA sign] (sign 2 = no data yet), updated in place.
+    - mid_price: The current mid-price.
+    - short_window, long_window, deviation: The Trader's MA settings.
+    Returns 1 for BUY, -1 for SELL, 0 for HOLD.
+    """
+    n = int(state[0])
+    slot = n % long_window
+    long_evicted = ring[slot] if n >= long_window else 0.0
+    short_evicted = ring[(n - short_window) % long_window] if n >= short_window else 0.0
+    ring[slot] = mid_price
+    state[0] = n + 1
+    state[1] += mid_price - short_evicted
+    state[2] += mid_price - long_evicted
+
+    short_ma = state[1] / short_window if n + 1 >= short_window else mid_price
+    long_ma = state[2] / long_window if n + 1 >= long_window else mid_price
+    gap = short_ma - long_ma
+    sign = 1.0 if gap > 0 else (-1.0 if gap < 0 else 0.0)
+    prev_sign = state[3]
+    state[3] = sign
+
+    if prev_sign == 2.0 or sign == prev_sign or sign == 0.0:
+        return 0
+    if sign > 0:
+        return 1 if mid_price < long_ma * (1 - deviation) else 0
+    return -1 if mid_price > long_ma * (1 + deviation) else 0
+
 
 class Trader:
+    # Fixed attribute layout: no per-instance __dict__, and attribute access is a slot lookup
+    __slots__ = (
+        'debug_mode', 'max_position', 'short_window', 'long_window', 'deviation_threshold',
+        'price_history', '_short_buf', '_short_sum', '_long_sum',
+        '_cur_long_ma', '_ma_sign', '_prev_ma_sign',
+        'position', '_cb_prices', '_cb_qtys', '_cb_head', '_cb_tail', '_cb_total_cost',
+        'realized_pnl', 'seashells_balance',
+        '_kernel_active', '_ma_ring', '_ma_state', '_tick_ts',
+    )
+
     def __init__(self, debug_mode: bool = True):
         """
         Initialize the Trader class with necessary variables and settings.
         - debug_mode: If True, print detailed logs for debugging and understanding.
         """
         self.debug_mode = debug_mode  # Controls whether we print logs or not
+        self._tick_ts = str(datetime.now())  # Timestamp shown on log lines, refreshed once per tick in run()
 
         # Configuration for SQUID_INK
         self.max_position = 50  # Maximum position limit in either direction (+50 or -50)
@@ -20,38 +78,71 @@ class Trader:
 
         # Data storage for price history and moving averages
         self.price_history = deque(maxlen=self.long_window)  # Store mid-prices to calculate moving averages
-        self.short_ma_history = deque(maxlen=self.long_window)  # Store short-term moving averages
-        self.long_ma_history = deque(maxlen=self.long_window)   # Store long-term moving averages
+        self._short_buf = deque(maxlen=self.short_window)  # Last short_window mid-prices for the rolling short sum
+        self._short_sum = 0.0  # Running sum of _short_buf
+        self._long_sum = 0.0   # Running sum of price_history
+        self._cur_long_ma = None  # Latest long-term MA, used as fair value (None until the first mid-price)
+        # Sign of (short MA - long MA) for this tick and the previous one: 1 above, -1 below, 0 equal.
+        # A change of sign is a crossover, so detect_signal compares two ints instead of four floats.
+        self._ma_sign = None
+        self._prev_ma_sign = None
+
+        # Compiled fast path (see _ma_step), used by run() whenever numba is available and debug_mode
+        # is off. _kernel_active records which copy of the MA state is current, so that toggling
+        # debug_mode between ticks hands the window over instead of leaving the other copy stale.
+        self._kernel_active = False
+        self._ma_ring = np.zeros(self.long_window, dtype=np.float64)
+        self._ma_state = np.array([0.0, 0.0, 0.0, 2.0])
 
         # Position and PnL tracking
         self.position = 0  # Current position in SQUID_INK (positive for long, negative for short)
-        self.cost_basis = deque()  # FIFO queue of (price, qty) tuples to track cost basis for PnL
+        # FIFO cost basis for PnL, stored as parallel price/qty arrays used as a queue:
+        # open lots live in [_cb_head, _cb_tail), oldest lot first
+        self._cb_prices = np.empty(64, dtype=np.float64)
+        self._cb_qtys = np.empty(64, dtype=np.int64)
+        self._cb_head = 0
+        self._cb_tail = 0
+        self._cb_total_cost = 0.0  # Running sum of price * qty over the open lots
         self.realized_pnl = 0.0  # Realized profit/loss in SeaShells
         self.seashells_balance = 0.0  # Balance in SeaShells (not used directly but tracked for completeness)
 
     def log(self, message: str):
         """
-        Log a message with a timestamp if debug_mode is True.
+        Log a message with the current tick's timestamp if debug_mode is True.
+        Callers that format their message (f-strings) check debug_mode first so the
+        formatting is skipped entirely when logging is off.
         - message: The string message to log.
         """
         if self.debug_mode:
-            print(f"[{datetime.now()}] {message}")
+            print(f"[{self._tick_ts}] {message}")
+
+    def best_prices(self, order_depth: OrderDepth) -> tuple:
+        """
+        Return the (best_bid, best_ask) of an order book.
+        run() calls this once per tick and passes the result on, so the book's keys are scanned once.
+        - order_depth: The OrderDepth object containing buy_orders and sell_orders.
+        Returns a tuple of (best_bid, best_ask); either side is None when that side is empty.
+        """
+        best_bid = max(order_depth.buy_orders) if order_depth.buy_orders else None
+        best_ask = min(order_depth.sell_orders) if order_depth.sell_orders else None
+        return best_bid, best_ask
 
-    def calculate_mid_price(self, order_depth: OrderDepth) -> float:
+    def calculate_mid_price(self, order_depth: OrderDepth, best: tuple = None) -> float:
         """
         Calculate the mid-price as the average of the best bid and best ask.
         This is our estimate of the current market price for SQUID_INK.
         - order_depth: The OrderDepth object containing buy_orders and sell_orders.
+        - best: Optional (best_bid, best_ask) already taken from order_depth; looked up if omitted.
         Returns the mid-price as a float.
         """
         if not order_depth.buy_orders or not order_depth.sell_orders:
             self.log("No buy or sell orders available to calculate mid-price.")
             return None
 
-        best_bid = max(order_depth.buy_orders.keys())  # Highest price someone is willing to buy at
-        best_ask = min(order_depth.sell_orders.keys())  # Lowest price someone is willing to sell at
+        best_bid, best_ask = best if best is not None else self.best_prices(order_depth)  # Highest bid / lowest ask in the book
         mid_price = (best_bid + best_ask) / 2
-        self.log(f"Mid-price calculated: Best Bid = {best_bid}, Best Ask = {best_ask}, Mid-Price = {mid_price:.2f}")
+        if self.debug_mode:
+            self.log(f"Mid-price calculated: Best Bid = {best_bid}, Best Ask = {best_ask}, Mid-Price = {mid_price:.2f}")
         return mid_price
 
     def update_moving_averages(self, mid_price: float):
@@ -59,26 +150,65 @@ class Trader:
         Update the short-term and long-term moving averages with the latest mid-price.
         - mid_price: The current mid-price to add to the price history.
         """
-        # Add the new mid-price to the price history
+        # Add the new mid-price to the price history, keeping the rolling sums in step.
+        # Capture the evicted prices first so each update is O(1) instead of a full window scan.
+        long_evicted = self.price_history[0] if len(self.price_history) == self.long_window else 0.0
+        short_evicted = self._short_buf[0] if len(self._short_buf) == self.short_window else 0.0
         self.price_history.append(mid_price)
+        self._short_buf.append(mid_price)
+        self._long_sum += mid_price - long_evicted
+        self._short_sum += mid_price - short_evicted
 
         # Calculate short-term moving average (last 5 prices)
         if len(self.price_history) >= self.short_window:
-            short_ma = statistics.mean(list(self.price_history)[-self.short_window:])
-            self.short_ma_history.append(short_ma)
-            self.log(f"Short-term MA (window={self.short_window}): {short_ma:.2f}")
+            short_ma = self._short_sum / self.short_window
+            if self.debug_mode:
+                self.log(f"Short-term MA (window={self.short_window}): {short_ma:.2f}")
         else:
-            self.short_ma_history.append(mid_price)  # Use mid-price until we have enough data
-            self.log(f"Short-term MA not yet available, using mid-price: {mid_price:.2f}")
+            short_ma = mid_price  # Use mid-price until we have enough data
+            if self.debug_mode:
+                self.log(f"Short-term MA not yet available, using mid-price: {mid_price:.2f}")
 
         # Calculate long-term moving average (last 20 prices)
         if len(self.price_history) >= self.long_window:
-            long_ma = statistics.mean(list(self.price_history))
-            self.long_ma_history.append(long_ma)
-            self.log(f"Long-term MA (window={self.long_window}): {long_ma:.2f}")
+            long_ma = self._long_sum / self.long_window
+            if self.debug_mode:
+                self.log(f"Long-term MA (window={self.long_window}): {long_ma:.2f}")
         else:
-            self.long_ma_history.append(mid_price)  # Use mid-price until we have enough data
-            self.log(f"Long-term MA not yet available, using mid-price: {mid_price:.2f}")
+            long_ma = mid_price  # Use mid-price until we have enough data
+            if self.debug_mode:
+                self.log(f"Long-term MA not yet available, using mid-price: {mid_price:.2f}")
+
+        self._cur_long_ma = long_ma
+
+        # Record which side of the long MA the short MA is on
+        ma_gap = short_ma - long_ma
+        self._prev_ma_sign = self._ma_sign
+        self._ma_sign = (ma_gap > 0) - (ma_gap < 0)
+
+    def _handover_ma_state(self, to_kernel: bool):
+        """
+        Copy the moving-average window and crossover state between the Python attributes and the
+        arrays used by _ma_step, so either path continues exactly where the other left off.
+        - to_kernel: True to load the kernel arrays from the Python state, False for the reverse.
+        """
+        if to_kernel:
+            n = len(self.price_history)
+            self._ma_ring[:n] = list(self.price_history)  # Oldest first, so slot n % long_window is next
+            self._ma_state[:] = (n, self._short_sum, self._long_sum, 2.0 if self._ma_sign is None else self._ma_sign)
+        else:
+            n = int(self._ma_state[0])
+            count = min(n, self.long_window)
+            window = [float(self._ma_ring[(n - count + i) % self.long_window]) for i in range(count)]
+            self.price_history = deque(window, maxlen=self.long_window)
+            self._short_buf = deque(window[-self.short_window:], maxlen=self.short_window)
+            self._short_sum = float(self._ma_state[1])
+            self._long_sum = float(self._ma_state[2])
+            sign = int(self._ma_state[3])
+            self._ma_sign = None if sign == 2 else sign
+            if count:
+                self._cur_long_ma = self._long_sum / self.long_window if count >= self.long_window else window[-1]
+        self._kernel_active = to_kernel
 
     def detect_signal(self, mid_price: float) -> str:
         """
@@ -87,47 +217,48 @@ class Trader:
         Returns a signal: "BUY", "SELL", or "HOLD".
         """
         # Need at least two periods of moving averages to detect a crossover
-        if len(self.short_ma_history) < 2 or len(self.long_ma_history) < 2:
+        if self._prev_ma_sign is None:
             self.log("Not enough MA data to detect signals. Holding position.")
             return "HOLD"
 
-        # Get current and previous moving averages
-        current_short_ma = self.short_ma_history[-1]
-        previous_short_ma = self.short_ma_history[-2]
-        current_long_ma = self.long_ma_history[-1]
-        previous_long_ma = self.long_ma_history[-1]
-
         # Fair value is approximated as the current long-term MA (our estimate of the "true" price)
-        fair_value = current_long_ma
-        self.log(f"Fair Value (Long-term MA): {fair_value:.2f}")
+        fair_value = self._cur_long_ma
+        if self.debug_mode:
+            self.log(f"Fair Value (Long-term MA): {fair_value:.2f}")
+
+        # A crossover happens when the short MA moves strictly to the other side of the long MA;
+        # staying on the same side, or merely touching it (sign 0), is not a crossover.
+        if self._ma_sign == self._prev_ma_sign or self._ma_sign == 0:
+            self.log("No MA crossover detected. Holding position.")
+            return "HOLD"
 
         # Detect crossover for cyclical behavior
         # Buy signal: Short MA crosses above Long MA (trough), and price is below fair value
         # Sell signal: Short MA crosses below Long MA (peak), and price is above fair value
-        if (previous_short_ma <= previous_long_ma and current_short_ma > current_long_ma):
+        if self._ma_sign > 0:
             self.log("Inflection Point Detected: Short MA crossed above Long MA (Potential Trough).")
             # Confirm the buy signal with price deviation
             if mid_price < fair_value * (1 - self.deviation_threshold):
-                self.log(f"BUY Signal: Price {mid_price:.2f} is {((fair_value - mid_price) / fair_value * 100):.2f}% below Fair Value {fair_value:.2f}")
+                if self.debug_mode:
+                    self.log(f"BUY Signal: Price {mid_price:.2f} is {((fair_value - mid_price) / fair_value * 100):.2f}% below Fair Value {fair_value:.2f}")
                 return "BUY"
             else:
-                self.log(f"Price {mid_price:.2f} not sufficiently below Fair Value {fair_value:.2f}. Holding.")
+                if self.debug_mode:
+                    self.log(f"Price {mid_price:.2f} not sufficiently below Fair Value {fair_value:.2f}. Holding.")
                 return "HOLD"
 
-        elif (previous_short_ma >= previous_long_ma and current_short_ma < current_long_ma):
+        else:
             self.log("Inflection Point Detected: Short MA crossed below Long MA (Potential Peak).")
             # Confirm the sell signal with price deviation
             if mid_price > fair_value * (1 + self.deviation_threshold):
-                self.log(f"SELL Signal: Price {mid_price:.2f} is {((mid_price - fair_value) / fair_value * 100):.2f}% above Fair Value {fair_value:.2f}")
+                if self.debug_mode:
+                    self.log(f"SELL Signal: Price {mid_price:.2f} is {((mid_price - fair_value) / fair_value * 100):.2f}% above Fair Value {fair_value:.2f}")
                 return "SELL"
             else:
-                self.log(f"Price {mid_price:.2f} not sufficiently above Fair Value {fair_value:.2f}. Holding.")
+                if self.debug_mode:
+                    self.log(f"Price {mid_price:.2f} not sufficiently above Fair Value {fair_value:.2f}. Holding.")
                 return "HOLD"
 
-        else:
-            self.log("No MA crossover detected. Holding position.")
-            return "HOLD"
-
     def simulate_execution(self, order_depth: OrderDepth, volume: int, is_buy: bool) -> tuple[float, int]:
         """
         Simulate executing a trade to calculate the average price and filled volume.
@@ -136,6 +267,7 @@ class Trader:
         - is_buy: True if buying, False if selling.
         Returns a tuple of (average_price, filled_volume).
         """
+        # Walk the book best-price-first, stopping once the volume is filled
         if is_buy:
             orders = sorted(order_depth.sell_orders.items())  # Sell orders for buying
             direction = 1
@@ -158,9 +290,32 @@ class Trader:
 
         avg_price = total_cost / filled if filled > 0 else 0
         filled_volume = direction * filled
-        self.log(f"Simulated Execution: {'BUY' if is_buy else 'SELL'} {abs(filled_volume)} @ {avg_price:.2f}")
+        if self.debug_mode:
+            self.log(f"Simulated Execution: {'BUY' if is_buy else 'SELL'} {abs(filled_volume)} @ {avg_price:.2f}")
         return avg_price, filled_volume
 
+    def _cb_push(self, price: float, qty: int):
+        """
+        Append a lot to the back of the cost basis queue.
+        - price: The price the lot was bought at.
+        - qty: The quantity bought.
+        """
+        if self._cb_tail == len(self._cb_prices):
+            # Out of room at the back: slide the open lots to the front, growing if still full
+            h, t = self._cb_head, self._cb_tail
+            size = t - h
+            capacity = len(self._cb_prices) * (2 if size == len(self._cb_prices) else 1)
+            prices = np.empty(capacity, dtype=np.float64)
+            qtys = np.empty(capacity, dtype=np.int64)
+            prices[:size] = self._cb_prices[h:t]
+            qtys[:size] = self._cb_qtys[h:t]
+            self._cb_prices, self._cb_qtys = prices, qtys
+            self._cb_head, self._cb_tail = 0, size
+        self._cb_prices[self._cb_tail] = price
+        self._cb_qtys[self._cb_tail] = qty
+        self._cb_tail += 1
+        self._cb_total_cost += price * qty
+
     def update_position_and_pnl(self, price: float, volume: int):
         """
         Update the position, cost basis, and realized PnL after a trade.
@@ -168,43 +323,50 @@ class Trader:
         - volume: The volume traded (positive for buy, negative for sell).
         """
         self.position += volume  # Update position
-        self.log(f"Updated Position: {self.position}")
+        if self.debug_mode:
+            self.log(f"Updated Position: {self.position}")
 
         if volume > 0:  # Buy trade
-            self.cost_basis.append((price, volume))
+            self._cb_push(price, volume)
             self.seashells_balance -= price * volume
-            self.log(f"BUY: Added to cost basis - Price: {price:.2f}, Qty: {volume}")
+            if self.debug_mode:
+                self.log(f"BUY: Added to cost basis - Price: {price:.2f}, Qty: {volume}")
 
         elif volume < 0:  # Sell trade
             volume_left = abs(volume)
-            while volume_left > 0 and self.cost_basis:
-                basis_price, basis_qty = self.cost_basis[0]
+            while volume_left > 0 and self._cb_head < self._cb_tail:
+                basis_price = float(self._cb_prices[self._cb_head])
+                basis_qty = int(self._cb_qtys[self._cb_head])
                 qty_to_close = min(volume_left, basis_qty)
                 profit = (price - basis_price) * qty_to_close
                 self.realized_pnl += profit
                 self.seashells_balance += price * qty_to_close
                 volume_left -= qty_to_close
+                self._cb_total_cost -= basis_price * qty_to_close
                 if qty_to_close == basis_qty:
-                    self.cost_basis.popleft()
+                    self._cb_head += 1
+                    if self._cb_head == self._cb_tail:
+                        self._cb_total_cost = 0.0  # Queue is empty; drop any accumulated rounding error
                 else:
-                    self.cost_basis[0] = (basis_price, basis_qty - qty_to_close)
-                self.log(f"SELL: Realized PnL += {profit:.2f}, New Realized PnL: {self.realized_pnl:.2f}")
+                    self._cb_qtys[self._cb_head] = basis_qty - qty_to_close
+                if self.debug_mode:
+                    self.log(f"SELL: Realized PnL += {profit:.2f}, New Realized PnL: {self.realized_pnl:.2f}")
 
-    def calculate_unrealized_pnl(self, order_depth: OrderDepth) -> float:
+    def calculate_unrealized_pnl(self, order_depth: OrderDepth, best: tuple = None) -> float:
         """
         Calculate the unrealized PnL based on the current market price.
         - order_depth: The OrderDepth object to get current market prices.
+        - best: Optional (best_bid, best_ask) already taken from order_depth; looked up if omitted.
         Returns the unrealized PnL as a float.
         """
         if self.position == 0 or not order_depth.buy_orders or not order_depth.sell_orders:
             return 0.0
 
-        best_bid = max(order_depth.buy_orders.keys())
-        best_ask = min(order_depth.sell_orders.keys())
+        best_bid, best_ask = best if best is not None else self.best_prices(order_depth)
         mark_price = best_bid if self.position > 0 else best_ask  # Use bid if long, ask if short
-        total_cost = sum(p * q for p, q in self.cost_basis)
-        unrealized = self.position * (mark_price - total_cost / self.position) if self.position != 0 else 0.0
-        self.log(f"Unrealized PnL: Mark Price = {mark_price:.2f}, Position = {self.position}, Unrealized PnL = {unrealized:.2f}")
+        unrealized = self.position * mark_price - self._cb_total_cost
+        if self.debug_mode:
+            self.log(f"Unrealized PnL: Mark Price = {mark_price:.2f}, Position = {self.position}, Unrealized PnL = {unrealized:.2f}")
         return unrealized
 
     def generate_orders(self, order_depth: OrderDepth, signal: str) -> List[Order]:
@@ -226,7 +388,8 @@ class Trader:
                 if filled > 0:
                     orders.append(Order("SQUID_INK", avg_price, filled))
                     self.update_position_and_pnl(avg_price, filled)
-                    self.log(f"EXECUTED BUY: {filled} @ {avg_price:.2f}")
+                    if self.debug_mode:
+                        self.log(f"EXECUTED BUY: {filled} @ {avg_price:.2f}")
 
         elif signal == "SELL" and self.position > -self.max_position:
             size = min(base_size, self.max_position + self.position)
@@ -235,19 +398,24 @@ class Trader:
                 if filled < 0:
                     orders.append(Order("SQUID_INK", avg_price, filled))
                     self.update_position_and_pnl(avg_price, filled)
-                    self.log(f"EXECUTED SELL: {abs(filled)} @ {avg_price:.2f}")
+                    if self.debug_mode:
+                        self.log(f"EXECUTED SELL: {abs(filled)} @ {avg_price:.2f}")
 
         else:
             self.log("No trade executed: Signal is HOLD or position limit reached.")
 
         return orders
 
-    def print_summary(self, order_depth: OrderDepth):
+    def print_summary(self, order_depth: OrderDepth, best: tuple = None):
         """
         Print a summary of the current state, including position and PnL.
         - order_depth: The OrderDepth object to calculate unrealized PnL.
+        - best: Optional (best_bid, best_ask) already taken from order_depth.
         """
-        unrealized = self.calculate_unrealized_pnl(order_depth)
+        if not self.debug_mode:
+            return  # The summary is only logged, so skip the PnL work when logging is off
+
+        unrealized = self.calculate_unrealized_pnl(order_depth, best)
         total_pnl = self.realized_pnl + unrealized
         self.log("\n=== Trading Summary ===")
         self.log(f"SQUID_INK: Position = {self.position}")
@@ -264,9 +432,14 @@ class Trader:
         # Initialize the result dictionary for orders
         result = {"SQUID_INK": []}
 
+        # Read the clock once per tick rather than on every log line
+        if self.debug_mode:
+            self._tick_ts = str(datetime.now())
+
         # Update position from the state
         self.position = state.position.get("SQUID_INK", 0)
-        self.log(f"Starting Position: {self.position}")
+        if self.debug_mode:
+            self.log(f"Starting Position: {self.position}")
 
         # Get the order depth for SQUID_INK
         if "SQUID_INK" not in state.order_depths:
@@ -275,25 +448,38 @@ class Trader:
 
         order_depth = state.order_depths["SQUID_INK"]
 
+        # Look up the best bid/ask once; later steps reuse them
+        best = self.best_prices(order_depth)
+
         # Step 1: Calculate the mid-price
-        mid_price = self.calculate_mid_price(order_depth)
+        mid_price = self.calculate_mid_price(order_depth, best)
         if mid_price is None:
             self.log("Cannot proceed without a valid mid-price. Skipping this tick.")
             return result, 0, ""
 
-        # Step 2: Update moving averages
-        self.update_moving_averages(mid_price)
+        use_kernel = HAVE_NUMBA and not self.debug_mode
+        if use_kernel != self._kernel_active:
+            self._handover_ma_state(use_kernel)
+
+        if use_kernel:
+            # Steps 2-3 in one compiled call
+            signal = SIGNALS[_ma_step(self._ma_ring, self._ma_state, mid_price,
+                                      self.short_window, self.long_window, self.deviation_threshold)]
+        else:
+            # Step 2: Update moving averages
+            self.update_moving_averages(mid_price)
 
-        # Step 3: Detect trading signal
-        signal = self.detect_signal(mid_price)
-        self.log(f"Trading Signal: {signal}")
+            # Step 3: Detect trading signal
+            signal = self.detect_signal(mid_price)
+        if self.debug_mode:
+            self.log(f"Trading Signal: {signal}")
 
         # Step 4: Generate orders based on the signal
         orders = self.generate_orders(order_depth, signal)
         result["SQUID_INK"] = orders
 
         # Step 5: Print summary of position and PnL
-        self.print_summary(order_depth)
+        self.print_summary(order_depth, best)
 
         # No conversions since we're only trading SQUID_INK in SeaShells
         conversions = 0
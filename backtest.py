@@ -2,6 +2,8 @@ from datamodel import OrderDepth, Order, TradingState
 from typing import Dict, List
 
 class Trader:
+    __slots__ = ()  # Stateless between ticks, so no per-instance __dict__ is needed
+
     def run(self, state: TradingState):
         result = {}
         position_limit = 50  # Position limit for each product
@@ -12,8 +14,8 @@ class Trader:
             current_position = state.position.get(product, 0)
             
             # Calculate fair value as midpoint between best bid and ask
-            best_bid = max(order_depth.buy_orders.keys()) if order_depth.buy_orders else None
-            best_ask = min(order_depth.sell_orders.keys()) if order_depth.sell_orders else None
+            best_bid = max(order_depth.buy_orders) if order_depth.buy_orders else None
+            best_ask = min(order_depth.sell_orders) if order_depth.sell_orders else None
             
             if best_bid is None or best_ask is None:
                 continue  # Skip if no orders on one side
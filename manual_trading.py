@@ -1,67 +1,79 @@
-# Define the conversion rates from the table
-conversion_rates = {
-    "Snowballs": {"Snowballs": 1.0, "Pizzas": 1.45, "Silicon Nuggets": 0.52, "SeaShells": 0.72},
-    "Pizzas": {"Snowballs": 0.7, "Pizzas": 1.0, "Silicon Nuggets": 0.31, "SeaShells": 0.48},
-    "Silicon Nuggets": {"Snowballs": 1.95, "Pizzas": 3.1, "Silicon Nuggets": 1.0, "SeaShells": 1.49},
-    "SeaShells": {"Snowballs": 1.34, "Pizzas": 1.98, "Silicon Nuggets": 0.64, "SeaShells": 1.0}
-}
+import math
+import numpy as np
 
-# List of currencies (excluding SeaShells for intermediate steps, but including it for conversions)
+# List of currencies (including SeaShells, which is where every path starts and ends)
 currencies = ["Snowballs", "Pizzas", "Silicon Nuggets", "SeaShells"]
-intermediate_currencies = ["Snowballs", "Pizzas", "Silicon Nuggets"]  # Exclude SeaShells for intermediate steps
 
-# Track if we find any profitable paths
-profitable = False
-print("Analyzing all possible conversion paths starting and ending with SeaShells...\n")
+# Define the conversion rates from the table as a matrix indexed like currencies:
+# conversion_rates[i, j] is how much of currencies[j] one unit of currencies[i] buys
+conversion_rates = np.array([
+    [1.0, 1.45, 0.52, 0.72],   # Snowballs
+    [0.7, 1.0, 0.31, 0.48],    # Pizzas
+    [1.95, 3.1, 1.0, 1.49],    # Silicon Nuggets
+    [1.34, 1.98, 0.64, 1.0],   # SeaShells
+], dtype=np.float64)
+
+start_currency = "SeaShells"
+max_trades = 5  # Up to 5 conversions per path
 
 # Start with 1 SeaShell
 initial_amount = 1.0
 
-# Five nested loops to explore paths of up to 5 conversions
-for curr1 in intermediate_currencies:
-    # Step 1: SeaShells -> curr1
-    rate1 = conversion_rates["SeaShells"][curr1]
-    amount1 = initial_amount * rate1
+# Turn the rate table into a graph with -log(rate) edge weights: multiplying rates along a path
+# becomes adding weights, so the most profitable path is the shortest one (Bellman-Ford).
+# The weights live in a matrix so each relaxation step is one vectorized NumPy expression.
+W = -np.log(conversion_rates)
+np.fill_diagonal(W, np.inf)  # Converting a currency into itself is not a trade
+start = currencies.index(start_currency)
 
-    for curr2 in intermediate_currencies:
-        # Step 2: curr1 -> curr2
-        rate2 = conversion_rates[curr1][curr2]
-        amount2 = amount1 * rate2
+print("Analyzing conversion paths starting and ending with SeaShells...\n")
 
-        for curr3 in intermediate_currencies:
-            # Step 3: curr2 -> curr3
-            rate3 = conversion_rates[curr2][curr3]
-            amount3 = amount2 * rate3
+# Bounded Bellman-Ford: dist[k][c] is the best weight reaching c in exactly k trades and
+# pred[k][c] the currency we came from, so every path respects the max_trades limit.
+# (Plain matrix_power would sum over paths rather than take the best one, so each hop is
+# a (min, +) product: candidates[u, v] = dist[u] + W[u, v], minimized over u.)
+# SeaShells is only allowed as the final hop: round_trip[k] records arriving there after k
+# trades, and it is then masked out of dist[k] so no later hop can pass through it.
+dist = [np.full(len(currencies), np.inf)]
+dist[0][start] = 0.0
+pred = [None]
+round_trip = [np.inf]
+for k in range(1, max_trades + 1):
+    candidates = dist[k - 1][:, None] + W
+    pred.append(candidates.argmin(axis=0))
+    layer = candidates.min(axis=0)
+    round_trip.append(layer[start])
+    layer[start] = np.inf
+    dist.append(layer)
 
-            for curr4 in intermediate_currencies:
-                # Step 4: curr3 -> curr4
-                rate4 = conversion_rates[curr3][curr4]
-                amount4 = amount3 * rate4
+# Pick the number of trades that gives the best round trip back to SeaShells
+best_trades = min(range(1, max_trades + 1), key=lambda k: round_trip[k])
 
-                # Step 5: curr4 -> SeaShells
-                rate5 = conversion_rates[curr4]["SeaShells"]
-                final_amount = amount4 * rate5
+# Reconstruct the path by following the predecessor map back through each layer
+path = [start]
+for k in range(best_trades, 0, -1):
+    path.append(int(pred[k][path[-1]]))
+path = [currencies[i] for i in reversed(path)]
 
-                # Calculate profit and edge
-                profit = final_amount - initial_amount
-                edge = (final_amount - initial_amount) / initial_amount * 100
+final_amount = initial_amount * math.exp(-round_trip[best_trades])
+profit = final_amount - initial_amount
+edge = (final_amount - initial_amount) / initial_amount * 100
 
-                # Construct the path
-                path = f"SeaShells -> {curr1} -> {curr2} -> {curr3} -> {curr4} -> SeaShells"
+print(f"Best Path ({best_trades} trades): {' -> '.join(path)}")
+print(f"  Start: {initial_amount:.4f} SeaShells, End: {final_amount:.4f} SeaShells")
+print(f"  {'Profit' if profit > 0 else 'Loss'}: {profit:.4f} SeaShells, Edge: {edge:.2f}%\n")
 
-                # Check if the path is profitable
-                if final_amount > initial_amount:
-                    profitable = True
-                    print(f"Profitable Path: {path}")
-                    print(f"  Start: {initial_amount:.4f} SeaShells, End: {final_amount:.4f} SeaShells")
-                    print(f"  Profit: {profit:.4f} SeaShells, Edge: {edge:.2f}%\n")
-                else:
-                    print(f"Non-profitable Path: {path}")
-                    print(f"  Start: {initial_amount:.4f} SeaShells, End: {final_amount:.4f} SeaShells")
-                    print(f"  Loss: {profit:.4f} SeaShells, Edge: {edge:.2f}%\n")
+# A final unbounded relaxation pass that still improves a distance means there is a
+# profitable cycle, i.e. repeating it without a trade limit would keep making SeaShells.
+cycle = np.full(len(currencies), np.inf)
+cycle[start] = 0.0
+for _ in range(len(currencies) - 1):
+    cycle = np.minimum(cycle, (cycle[:, None] + W).min(axis=0))
+has_cycle = bool(((cycle[:, None] + W).min(axis=0) < cycle).any())
+print(f"Profitable cycle in the rate table: {'Yes' if has_cycle else 'No'}\n")
 
 # Summary
-if profitable:
+if final_amount > initial_amount:
     print("Yes, manual trading can be profitable starting and ending with SeaShells!")
 else:
-    print("No profitable paths found starting and ending with SeaShells.")
\ No newline at end of file
+    print("No profitable paths found starting and ending with SeaShells.")
@@ -1,5 +1,6 @@
 from datamodel import OrderDepth, Listing, TradingState, Observation
-from Trader import Trader
+from Trader import Trader, SIGNALS, _ma_step
+import random
 from collections import defaultdict
 
 class Backtester:
@@ -7,6 +8,19 @@ class Backtester:
         self.trader = trader_class()
         self.history = []
         self.cumulative_pnl = 0
+        self._listing_by_product = {}  # product -> Listing, shared by every listings dict
+        self._listings_by_product_set = {}  # frozenset of products -> listings dict, reused across ticks
+        # A single TradingState is reused; only the per-tick fields are updated in simulate_tick
+        self._state = TradingState(
+            timestamp=0,
+            listings={},
+            order_depths={},
+            position={},
+            observations=Observation({}, {}),
+            own_trades=defaultdict(list),
+            market_trades=defaultdict(list),
+            traderData=""
+        )
         
     def create_order_depth(self, buy_orders: dict, sell_orders: dict) -> OrderDepth:
         """Helper method to properly create OrderDepth objects"""
@@ -17,16 +31,24 @@ class Backtester:
 
     def simulate_tick(self, timestamp, order_depths, positions):
         """Simulate a single trading tick"""
-        state = TradingState(
-            timestamp=timestamp,
-            listings={p: Listing(p, p, "SEASHELLS") for p in order_depths},
-            order_depths=order_depths,
-            position=positions,
-            observations=Observation({}, {}),
-            own_trades=defaultdict(list),
-            market_trades=defaultdict(list),
-            traderData=""
-        )
+        key = frozenset(order_depths)
+        listings = self._listings_by_product_set.get(key)
+        if listings is None:
+            listings = {}
+            for p in order_depths:
+                listing = self._listing_by_product.get(p)
+                if listing is None:
+                    listing = Listing(p, p, "SEASHELLS")
+                    self._listing_by_product[p] = listing
+                listings[p] = listing
+            self._listings_by_product_set[key] = listings
+
+        state = self._state
+        state.timestamp = timestamp
+        state.listings = listings
+        state.order_depths = order_depths
+        state.position = positions
+        state.traderData = ""  # No trader state carries over between ticks
         
         orders, conversions, _ = self.trader.run(state)
         
@@ -138,5 +160,70 @@ def run_backtest():
     # Print final results
     backtester.print_results()
 
+def feed_prices(trader, prices):
+    """Run mid-prices through the moving-average and signal steps, returning each tick's signal"""
+    signals = []
+    for price in prices:
+        trader.update_moving_averages(price)
+        signals.append(trader.detect_signal(price))
+    return signals
+
+def test_crossover_rules():
+    """Pin the crossover rules: BUY on short MA <= then > long MA, SELL on >= then <, a touch never fires"""
+    warmup = [100.0] * 20  # Flat prices keep the short MA exactly on the long MA
+
+    # Short MA strictly below, then above, the long MA while price is under fair value -> BUY
+    signals = feed_prices(Trader(debug_mode=False), warmup + [40.0, 100.0, 100.0, 100.0, 100.0, 90.0])
+    assert signals[20:] == ["HOLD"] * 5 + ["BUY"]
+
+    # Short MA strictly above, then below, the long MA while price is over fair value -> SELL
+    signals = feed_prices(Trader(debug_mode=False), warmup + [160.0, 100.0, 100.0, 100.0, 100.0, 110.0])
+    assert signals[20:] == ["HOLD"] * 5 + ["SELL"]
+
+    # Short MA moves from below to exactly on the long MA (a touch): HOLD.
+    # Then, starting from that tie, it crosses above while price is under fair value -> BUY
+    trader = Trader(debug_mode=False)
+    signals = feed_prices(trader, warmup + [40.0, 140.0, 100.0, 80.0, 140.0])
+    assert trader._prev_ma_sign == -1 and trader._ma_sign == 0
+    assert signals[-1] == "HOLD"
+    assert feed_prices(trader, [40.0]) == ["BUY"]
+
+    # Another touch from below holds; this time, starting from the tie, the short MA drops
+    # below while price is over fair value -> SELL
+    trader = Trader(debug_mode=False)
+    signals = feed_prices(trader, warmup + [120.0, 80.0, 40.0, 140.0, 120.0])
+    assert trader._prev_ma_sign == -1 and trader._ma_sign == 0
+    assert signals[-1] == "HOLD"
+    assert feed_prices(trader, [120.0]) == ["SELL"]
+
+def kernel_step(trader, price):
+    """Run one tick through the compiled _ma_step on the trader's kernel arrays"""
+    return SIGNALS[_ma_step(trader._ma_ring, trader._ma_state, price,
+                            trader.short_window, trader.long_window, trader.deviation_threshold)]
+
+def test_kernel_matches_python():
+    """_ma_step must give the same signals as update_moving_averages + detect_signal, including across handovers"""
+    rng = random.Random(7)
+    prices = [float(rng.randint(180, 220)) / 2 for _ in range(3000)]  # Coarse prices so MA ties occur
+    reference = feed_prices(Trader(debug_mode=False), prices)
+    assert "BUY" in reference and "SELL" in reference
+
+    # Kernel only
+    trader = Trader(debug_mode=False)
+    trader._handover_ma_state(True)
+    assert [kernel_step(trader, price) for price in prices] == reference
+
+    # Switching between the two paths every few ticks, as toggling debug_mode does in run()
+    trader = Trader(debug_mode=False)
+    signals = []
+    for i, price in enumerate(prices):
+        if i % 7 == 0:
+            trader._handover_ma_state(not trader._kernel_active)
+        if trader._kernel_active:
+            signals.append(kernel_step(trader, price))
+        else:
+            signals.extend(feed_prices(trader, [price]))
+    assert signals == reference
+
 if __name__ == "__main__":
     run_backtest()
\ No newline at end of file